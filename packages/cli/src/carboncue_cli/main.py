@@ -4,6 +4,7 @@ import asyncio
 
 import click
 from carboncue_sdk import CarbonClient, CarbonConfig
+from carboncue_sdk.models import CLOUD_PROVIDERS
 from rich.console import Console
 from rich.panel import Panel
 from rich.table import Table
@@ -32,7 +33,7 @@ def cli() -> None:
 @click.option(
     "--provider",
     "-p",
-    type=click.Choice(["aws", "azure", "gcp", "digitalocean", "other"]),
+    type=click.Choice(CLOUD_PROVIDERS),
     default="aws",
     help="Cloud provider",
 )
@@ -95,7 +96,7 @@ async def _check_intensity(region: str, provider: str) -> None:
 @click.option(
     "--provider",
     "-p",
-    type=click.Choice(["aws", "azure", "gcp", "digitalocean", "other"]),
+    type=click.Choice(CLOUD_PROVIDERS),
     default="aws",
     help="Cloud provider",
 )
@@ -1,18 +1,27 @@
-"""CarbonCue SDK - Core library for carbon-aware computing."""
-
-from carboncue_sdk.client import CarbonClient
-from carboncue_sdk.config import CarbonConfig
-from carboncue_sdk.exceptions import (
-    APIError,
-    AuthenticationError,
-    CarbonCueError,
-    DataNotAvailableError,
-    InvalidProviderError,
-    InvalidRegionError,
-    RateLimitError,
-)
-from carboncue_sdk.models import CarbonIntensity, Region, SCIScore
-from carboncue_sdk.region_mapper import RegionMapper
+"""CarbonCue SDK - Core library for carbon-aware computing.
+
+Public names are imported lazily on first attribute access, so importing the
+package (e.g. for a single SCI calculation in a short-lived script) does not
+pay for httpx, msgspec and every Pydantic model schema up front.
+"""
+
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from carboncue_sdk.client import CarbonClient
+    from carboncue_sdk.config import CarbonConfig
+    from carboncue_sdk.exceptions import (
+        APIError,
+        AuthenticationError,
+        CarbonCueError,
+        DataNotAvailableError,
+        InvalidProviderError,
+        InvalidRegionError,
+        RateLimitError,
+    )
+    from carboncue_sdk.models import CarbonIntensity, Region, SCIScore
+    from carboncue_sdk.region_mapper import RegionMapper
 
 __version__ = "1.1.0"
 __all__ = [
@@ -30,3 +39,40 @@ __all__ = [
     "AuthenticationError",
     "DataNotAvailableError",
 ]
+
+# Public name -> submodule that defines it
+_LAZY_IMPORTS: dict[str, str] = {
+    "CarbonClient": "client",
+    "CarbonConfig": "config",
+    "CarbonIntensity": "models",
+    "SCIScore": "models",
+    "Region": "models",
+    "RegionMapper": "region_mapper",
+    "CarbonCueError": "exceptions",
+    "APIError": "exceptions",
+    "InvalidRegionError": "exceptions",
+    "InvalidProviderError": "exceptions",
+    "RateLimitError": "exceptions",
+    "AuthenticationError": "exceptions",
+    "DataNotAvailableError": "exceptions",
+}
+_SUBMODULES = frozenset({"client", "config", "exceptions", "models", "region_mapper"})
+
+
+def __getattr__(name: str) -> Any:
+    """Import public names and submodules on first access."""
+    if name in _LAZY_IMPORTS:
+        value = getattr(import_module(f"carboncue_sdk.{_LAZY_IMPORTS[name]}"), name)
+    elif name in _SUBMODULES:
+        value = import_module(f"carboncue_sdk.{name}")
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    # Cache on the module so later lookups bypass __getattr__
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    """List public names and submodules, including those not imported yet."""
+    return sorted({*__all__, *_SUBMODULES, "__version__"})
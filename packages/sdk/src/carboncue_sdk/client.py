@@ -1,9 +1,14 @@
 """Main client for CarbonCue SDK."""
 
-from datetime import datetime, timedelta
+import asyncio
+from collections.abc import Iterator, Sequence
+from contextlib import contextmanager
+from contextvars import ContextVar
 from typing import Any
 
 import httpx
+import msgspec
+from cachetools import TTLCache
 
 from carboncue_sdk.config import CarbonConfig
 from carboncue_sdk.exceptions import (
@@ -14,8 +19,16 @@ from carboncue_sdk.exceptions import (
     InvalidRegionError,
     RateLimitError,
 )
-from carboncue_sdk.models import CarbonIntensity, SCIScore
-from carboncue_sdk.region_mapper import RegionMapper
+from carboncue_sdk.models import CarbonIntensity, ElectricityMapsPayload, SCIScore
+from carboncue_sdk.region_mapper import resolve_region
+
+# Built once; parses and validates raw response bytes in a single pass
+_INTENSITY_DECODER = msgspec.json.Decoder(ElectricityMapsPayload)
+
+_shared_client: "CarbonClient | None" = None
+
+# HTTP session bound to the current task (and the tasks it spawns) via use_session
+_session_var: ContextVar[httpx.AsyncClient | None] = ContextVar("carboncue_session", default=None)
 
 
 class CarbonClient:
@@ -40,50 +53,109 @@ class CarbonClient:
         """
         self.config = config or CarbonConfig()
         self._http_client: httpx.AsyncClient | None = None
-        self._cache: dict[str, tuple[Any, datetime]] = {}
+        # Keyed by Electricity Maps zone so regions sharing a zone share entries
+        self._cache: TTLCache[str, CarbonIntensity] | None = (
+            TTLCache(maxsize=self.config.cache_maxsize, ttl=self.config.cache_ttl_seconds)
+            if self.config.enable_caching
+            else None
+        )
+        self._zone_locks: dict[str, asyncio.Lock] = {}
+        # Event loop the pool and zone locks were created on
+        self._loop: asyncio.AbstractEventLoop | None = None
+
+    @classmethod
+    def shared(cls) -> "CarbonClient":
+        """Get a process-wide client whose connection pool is reused across calls.
+
+        Intended for long-running services (e.g. request handlers) that should
+        call methods directly rather than entering the client as a context
+        manager on every request. When it is used from a new event loop
+        (e.g. one asyncio.run per serverless invocation), it opens a fresh
+        pool for that loop.
+
+        Returns:
+            Shared client configured from the environment
+        """
+        global _shared_client
+        # No await between check and assignment, so this is race-free under asyncio
+        if _shared_client is None:
+            _shared_client = cls()
+        return _shared_client
+
+    @staticmethod
+    @contextmanager
+    def use_session(http_client: httpx.AsyncClient) -> Iterator[httpx.AsyncClient]:
+        """Route requests made in the current context through an existing HTTP client.
+
+        The binding is stored in a context variable, so it applies to the
+        current task and to tasks it creates, without any locking or entering
+        each CarbonClient as a context manager. The caller owns the HTTP
+        client and is responsible for closing it.
+
+        Example:
+            >>> async with httpx.AsyncClient(http2=True) as http_client:
+            ...     with CarbonClient.use_session(http_client):
+            ...         intensity = await client.get_current_intensity("us-west-2")
+
+        Args:
+            http_client: HTTP client to use for requests in this context
+
+        Yields:
+            The bound HTTP client
+        """
+        token = _session_var.set(http_client)
+        try:
+            yield http_client
+        finally:
+            _session_var.reset(token)
 
     async def __aenter__(self) -> "CarbonClient":
         """Async context manager entry."""
-        self._http_client = httpx.AsyncClient(
-            timeout=self.config.request_timeout,
-            headers={"auth-token": self.config.electricity_maps_api_key or ""},
-        )
+        self._get_http_client()
         return self
 
     async def __aexit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
         """Async context manager exit."""
-        if self._http_client:
-            await self._http_client.aclose()
-            self._http_client = None
+        await self.close()
 
-    def _get_from_cache(self, key: str) -> Any | None:
-        """Get value from cache if not expired.
+    def _get_http_client(self) -> httpx.AsyncClient:
+        """Get the HTTP client for the current context.
 
-        Args:
-            key: Cache key
+        A session bound with use_session takes precedence; otherwise the
+        client's own pool is used, created on first use.
 
         Returns:
-            Cached value if exists and not expired, None otherwise
+            HTTP client to send requests with
         """
-        if not self.config.enable_caching:
-            return None
-
-        if key in self._cache:
-            value, timestamp = self._cache[key]
-            if datetime.utcnow() - timestamp < timedelta(seconds=self.config.cache_ttl_seconds):
-                return value
-            del self._cache[key]
-        return None
+        session = _session_var.get()
+        if session is not None:
+            return session
+
+        self._bind_to_running_loop()
+        if self._http_client is None:
+            self._http_client = httpx.AsyncClient(
+                http2=True,
+                limits=httpx.Limits(
+                    max_connections=self.config.max_connections,
+                    max_keepalive_connections=self.config.max_keepalive_connections,
+                ),
+                timeout=self.config.request_timeout,
+            )
+        return self._http_client
 
-    def _set_cache(self, key: str, value: Any) -> None:
-        """Set value in cache.
+    def _bind_to_running_loop(self) -> None:
+        """Drop the pool and zone locks if they belong to another event loop.
 
-        Args:
-            key: Cache key
-            value: Value to cache
+        Both are bound to the loop they were first used on, and reusing them
+        from a later loop fails with RuntimeError. The previous loop has
+        usually been closed by then (as after asyncio.run), so its pool is
+        discarded rather than closed.
         """
-        if self.config.enable_caching:
-            self._cache[key] = (value, datetime.utcnow())
+        loop = asyncio.get_running_loop()
+        if loop is not self._loop:
+            self._loop = loop
+            self._http_client = None
+            self._zone_locks = {}
 
     async def get_current_intensity(self, region: str, provider: str = "aws") -> CarbonIntensity:
         """Get current carbon intensity for a region.
@@ -103,26 +175,111 @@ class CarbonClient:
             DataNotAvailableError: If data not available for region
             APIError: If API request fails
         """
-        cache_key = f"intensity:{provider}:{region}"
-        cached = self._get_from_cache(cache_key)
+        # Map cloud region to Electricity Maps zone
+        region, zone_id = self._resolve_region(region, provider)
+
+        intensity = await self._get_zone_intensity(zone_id, region)
+        return self._for_region(intensity, region)
+
+    async def get_current_intensities(
+        self, regions: list[str], provider: str = "aws"
+    ) -> list[CarbonIntensity]:
+        """Get current carbon intensity for several regions concurrently.
+
+        All regions are validated before any request is sent, and regions
+        that map to the same Electricity Maps zone share a single request.
+
+        Args:
+            regions: Region codes (e.g., ["us-west-2", "eu-west-1"])
+            provider: Cloud provider (aws, azure, gcp, etc.)
+
+        Returns:
+            Current carbon intensity data, in the same order as regions
+
+        Raises:
+            InvalidRegionError: If any region is not supported
+            InvalidProviderError: If provider is not supported
+            AuthenticationError: If API key is missing or invalid
+            RateLimitError: If API rate limit exceeded
+            DataNotAvailableError: If data not available for a region
+            APIError: If API request fails
+        """
+        resolved = [self._resolve_region(region, provider) for region in regions]
+
+        # One fetch per distinct zone, on behalf of the first region mapping to it
+        first_region_by_zone: dict[str, str] = {}
+        for region, zone_id in resolved:
+            first_region_by_zone.setdefault(zone_id, region)
+
+        fetched = await asyncio.gather(
+            *(
+                self._get_zone_intensity(zone_id, region)
+                for zone_id, region in first_region_by_zone.items()
+            )
+        )
+        by_zone = dict(zip(first_region_by_zone, fetched, strict=True))
+
+        return [self._for_region(by_zone[zone_id], region) for region, zone_id in resolved]
+
+    async def _get_zone_intensity(self, zone_id: str, region: str) -> CarbonIntensity:
+        """Get carbon intensity for a zone, from cache when possible.
+
+        Concurrent misses for the same zone wait on a per-zone lock so only
+        one of them reaches the API.
+
+        Args:
+            zone_id: Electricity Maps zone identifier
+            region: Cloud region the data is requested for
+
+        Returns:
+            Carbon intensity data, possibly recorded for another region in the zone
+        """
+        if self._cache is None:
+            return await self._fetch_from_electricity_maps(zone_id, region)
+
+        cached = self._cache.get(zone_id)
         if cached is not None:
-            return cached  # type: ignore[no-any-return]
+            return cached
+
+        self._bind_to_running_loop()
+        lock = self._zone_locks.setdefault(zone_id, asyncio.Lock())
+        async with lock:
+            cached = self._cache.get(zone_id)
+            if cached is None:
+                cached = await self._fetch_from_electricity_maps(zone_id, region)
+                self._cache[zone_id] = cached
+        return cached
+
+    @staticmethod
+    def _for_region(intensity: CarbonIntensity, region: str) -> CarbonIntensity:
+        """Return intensity data labelled with the requested region."""
+        if intensity.region == region:
+            return intensity
+        return intensity.model_copy(update={"region": region})
+
+    @staticmethod
+    def _resolve_region(region: str, provider: str) -> tuple[str, str]:
+        """Map a cloud region to its canonical code and Electricity Maps zone.
 
-        # Map cloud region to Electricity Maps zone
+        Args:
+            region: Region code (e.g., us-west-2)
+            provider: Cloud provider (aws, azure, gcp, etc.)
+
+        Returns:
+            Tuple of the mapper's interned region code and zone identifier
+
+        Raises:
+            InvalidRegionError: If region is not supported
+            InvalidProviderError: If provider is not supported
+        """
         try:
-            zone_id = RegionMapper.get_zone_id(region, provider)
+            return resolve_region(region, provider)
         except ValueError as e:
             error_msg = str(e)
             if "cloud provider" in error_msg.lower():
                 raise InvalidProviderError(error_msg) from e
             raise InvalidRegionError(error_msg) from e
 
-        # Get data from Electricity Maps API
-        intensity = await self._fetch_from_electricity_maps(zone_id, region)
-
-        self._set_cache(cache_key, intensity)
-        return intensity
-
     async def _fetch_from_electricity_maps(
         self, zone_id: str, original_region: str
     ) -> CarbonIntensity:
@@ -147,14 +304,15 @@ class CarbonClient:
                 "Set CARBONCUE_ELECTRICITY_MAPS_API_KEY environment variable."
             )
 
-        if not self._http_client:
-            raise APIError("HTTP client not initialized. Use async context manager.")
+        http_client = self._get_http_client()
 
         url = f"{self.config.electricity_maps_base_url}/carbon-intensity/latest"
         params = {"zone": zone_id}
+        # Sent per request so that sessions bound via use_session are authenticated too
+        headers = {"auth-token": self.config.electricity_maps_api_key}
 
         try:
-            response = await self._http_client.get(url, params=params)
+            response = await http_client.get(url, params=params, headers=headers)
 
             # Handle rate limiting
             if response.status_code == 429:
@@ -175,23 +333,23 @@ class CarbonClient:
             # Raise for other errors
             response.raise_for_status()
 
-            data = response.json()
+            try:
+                payload = _INTENSITY_DECODER.decode(response.content)
+            except msgspec.DecodeError as e:
+                raise APIError(
+                    f"Invalid carbon intensity data in response for zone: {zone_id}"
+                ) from e
 
-            # Extract data from Electricity Maps response
-            carbon_intensity = data.get("carbonIntensity")
-            fossil_fuel_pct = data.get("fossilFuelPercentage")
-            renewable_pct = data.get("renewablePercentage")
-
-            if carbon_intensity is None:
+            if payload.carbon_intensity is None:
                 raise DataNotAvailableError(
                     f"Carbon intensity value missing in response for zone: {zone_id}"
                 )
 
             return CarbonIntensity(
                 region=original_region,
-                carbon_intensity=float(carbon_intensity),
-                fossil_fuel_percentage=float(fossil_fuel_pct) if fossil_fuel_pct else None,
-                renewable_percentage=float(renewable_pct) if renewable_pct else None,
+                carbon_intensity=payload.carbon_intensity,
+                fossil_fuel_percentage=payload.fossil_fuel_percentage,
+                renewable_percentage=payload.renewable_percentage,
                 source="ElectricityMaps",
             )
 
@@ -223,10 +381,12 @@ class CarbonClient:
             Calculated SCI score
 
         Raises:
-            ValueError: If functional_unit is <= 0
+            ValueError: If functional_unit is <= 0 or emissions are negative
         """
         if functional_unit <= 0:
             raise ValueError("Functional unit must be greater than 0")
+        if operational_emissions < 0 or embodied_emissions < 0:
+            raise ValueError("Emissions must be greater than or equal to 0")
 
         score = (operational_emissions + embodied_emissions) / functional_unit
 
@@ -239,8 +399,62 @@ class CarbonClient:
             region=region,
         )
 
+    def calculate_sci_batch(
+        self,
+        operational_emissions: Sequence[float],
+        embodied_emissions: Sequence[float],
+        functional_units: Sequence[float],
+        functional_unit_type: str = "requests",
+        region: str = "us-west-2",
+    ) -> list[SCIScore]:
+        """Calculate SCI scores for many workloads at once.
+
+        Inputs are checked for the whole batch before any score is built, so
+        an invalid entry fails fast without partial results. Any sequence of
+        numbers is accepted, including NumPy arrays.
+
+        Args:
+            operational_emissions: O values in gCO2eq, one per workload
+            embodied_emissions: M values in gCO2eq, one per workload
+            functional_units: R values, one per workload
+            functional_unit_type: Type of functional unit (requests, users, etc.)
+            region: Region where computation occurred
+
+        Returns:
+            Calculated SCI scores, in input order
+
+        Raises:
+            ValueError: If inputs differ in length, any functional unit is <= 0
+                or any emissions value is negative
+        """
+        operational = [float(value) for value in operational_emissions]
+        embodied = [float(value) for value in embodied_emissions]
+        units = [float(value) for value in functional_units]
+
+        if not len(operational) == len(embodied) == len(units):
+            raise ValueError("Emissions and functional units must have the same length")
+        if not units:
+            return []
+        if min(units) <= 0:
+            raise ValueError("Functional unit must be greater than 0")
+        if min(operational) < 0 or min(embodied) < 0:
+            raise ValueError("Emissions must be greater than or equal to 0")
+
+        return [
+            SCIScore(
+                score=(o + m) / r,
+                operational_emissions=o,
+                embodied_emissions=m,
+                functional_unit=r,
+                functional_unit_type=functional_unit_type,
+                region=region,
+            )
+            for o, m, r in zip(operational, embodied, units, strict=True)
+        ]
+
     async def close(self) -> None:
         """Close the HTTP client and cleanup resources."""
+        self._bind_to_running_loop()
         if self._http_client:
             await self._http_client.aclose()
             self._http_client = None
@@ -1,5 +1,6 @@
 """Configuration management for CarbonCue SDK."""
 
+from pydantic import NonNegativeInt, PositiveInt
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
@@ -32,7 +33,10 @@ class CarbonConfig(BaseSettings):
     # Request Configuration
     request_timeout: int = 30
     max_retries: int = 3
+    max_connections: PositiveInt = 64
+    max_keepalive_connections: NonNegativeInt = 32
 
     # Cache Configuration
     cache_ttl_seconds: int = 300  # 5 minutes
+    cache_maxsize: PositiveInt = 1024
     enable_caching: bool = True
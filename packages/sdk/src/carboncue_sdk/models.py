@@ -1,27 +1,79 @@
 """Data models for CarbonCue SDK."""
 
 from datetime import datetime
-from typing import Literal
+from functools import lru_cache
+from typing import TYPE_CHECKING, Annotated, Any, Literal, get_args
 
+import msgspec
 from pydantic import BaseModel, ConfigDict, Field
 
 CloudProvider = Literal["aws", "azure", "gcp", "digitalocean", "other"]
+CLOUD_PROVIDERS: tuple[str, ...] = get_args(CloudProvider)
+
+# Immutable value types: existing instances are passed through by reference when
+# they appear as model input, rather than being copied and re-validated
+_VALUE_MODEL_CONFIG = ConfigDict(frozen=True, revalidate_instances="never", extra="ignore")
+
+# Encoder instances are reusable and cheaper to keep than to rebuild per call
+_JSON_ENCODER = msgspec.json.Encoder()
+
+
+class _JSONFastPathModel(BaseModel):
+    """Base for flat models whose default JSON form msgspec can encode directly."""
+
+    if TYPE_CHECKING:
+        # Type checkers see Pydantic's keyword-only signature, which varies
+        # across supported Pydantic versions, instead of the **kwargs below
+        model_dump_json = BaseModel.model_dump_json
+    else:
+
+        def model_dump_json(self, **kwargs: Any) -> str:
+            """Serialize to JSON, using msgspec when no serialization options are given.
+
+            The fast path encodes the field dict directly, so it only applies to
+            the SDK's own classes, whose fields are plain scalars and datetimes.
+            Subclasses (which may add excluded or computed fields or custom
+            serializers) and any option (indent, include, by_alias, ...) go
+            through Pydantic's serializer. The fast path yields the same JSON
+            values, but number formatting can differ (e.g. ``1e16`` vs
+            Pydantic's ``1e+16``).
+            """
+            if kwargs or type(self) not in _JSON_FAST_PATH_TYPES:
+                return super().model_dump_json(**kwargs)
+            return _JSON_ENCODER.encode(self.__dict__).decode()
 
 
 class Region(BaseModel):
     """Cloud region information."""
 
-    model_config = ConfigDict(frozen=True)
+    model_config = _VALUE_MODEL_CONFIG
 
     code: str = Field(..., description="Region code (e.g., us-west-2)")
     provider: CloudProvider = Field(..., description="Cloud provider")
     location: str | None = Field(None, description="Geographic location")
 
+    @classmethod
+    @lru_cache(maxsize=256)
+    def get(cls, code: str, provider: CloudProvider) -> "Region":
+        """Get a validated Region, reusing instances for repeated lookups.
+
+        Regions are immutable, so one instance per (code, provider) pair is
+        shared instead of re-validating on every construction.
+
+        Args:
+            code: Region code (e.g., us-west-2)
+            provider: Cloud provider
 
-class CarbonIntensity(BaseModel):
+        Returns:
+            Region without location information
+        """
+        return cls(code=code, provider=provider, location=None)
+
+
+class CarbonIntensity(_JSONFastPathModel):
     """Carbon intensity data for a specific region and time."""
 
-    model_config = ConfigDict(frozen=True)
+    model_config = _VALUE_MODEL_CONFIG
 
     region: str = Field(..., description="Region code")
     timestamp: datetime = Field(default_factory=datetime.utcnow, description="Measurement time")
@@ -35,7 +87,7 @@ class CarbonIntensity(BaseModel):
     source: str = Field(..., description="Data source (e.g., ElectricityMaps, GSF SDK)")
 
 
-class SCIScore(BaseModel):
+class SCIScore(_JSONFastPathModel):
     """Software Carbon Intensity (SCI) score per GSF specification.
 
     SCI = (O + M) / R
@@ -45,7 +97,7 @@ class SCIScore(BaseModel):
         R = Functional unit (requests, users, etc.)
     """
 
-    model_config = ConfigDict(frozen=True)
+    model_config = _VALUE_MODEL_CONFIG
 
     score: float = Field(..., ge=0, description="SCI score (gCO2eq per functional unit)")
     operational_emissions: float = Field(..., ge=0, description="O: Operational emissions (gCO2eq)")
@@ -58,10 +110,27 @@ class SCIScore(BaseModel):
     timestamp: datetime = Field(default_factory=datetime.utcnow, description="Calculation time")
 
 
+# Exact classes whose field dict is known to encode like Pydantic's serializer
+_JSON_FAST_PATH_TYPES: frozenset[type[BaseModel]] = frozenset({CarbonIntensity, SCIScore})
+
+
+class ElectricityMapsPayload(msgspec.Struct, frozen=True, gc=False, rename="camel"):
+    """Subset of the Electricity Maps `carbon-intensity/latest` response.
+
+    Internal to the client, so it uses a msgspec struct that is decoded
+    straight from response bytes rather than a Pydantic model.
+    """
+
+    carbon_intensity: Annotated[float, msgspec.Meta(gt=0)] | None = None
+    fossil_fuel_percentage: Annotated[float, msgspec.Meta(ge=0, le=100)] | None = None
+    renewable_percentage: Annotated[float, msgspec.Meta(ge=0, le=100)] | None = None
+
+
 class EmissionsBreakdown(BaseModel):
     """Detailed breakdown of carbon emissions."""
 
-    model_config = ConfigDict(frozen=True)
+    # Rarely used, so its validation schema is built on first use instead of at import
+    model_config = ConfigDict(**_VALUE_MODEL_CONFIG, defer_build=True)
 
     total_emissions: float = Field(..., ge=0, description="Total emissions (gCO2eq)")
     compute_emissions: float = Field(..., ge=0, description="Compute/CPU emissions")
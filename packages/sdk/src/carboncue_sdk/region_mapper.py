@@ -1,5 +1,6 @@
 """Region mapping utilities for cloud providers to Electricity Maps zones."""
 
+import sys
 from typing import Dict
 
 # Mapping of cloud provider regions to Electricity Maps zone IDs
@@ -95,66 +96,111 @@ REGION_TO_ZONE_MAP: Dict[str, Dict[str, str]] = {
 }
 
 
-class RegionMapper:
-    """Maps cloud provider regions to Electricity Maps zone identifiers."""
+# Lookup tables built once at import; each region maps to its own interned
+# key alongside the zone, so callers can reuse the canonical string
+_ZONES: dict[str, dict[str, tuple[str, str]]] = {
+    sys.intern(provider): {
+        sys.intern(region): (sys.intern(region), sys.intern(zone))
+        for region, zone in region_map.items()
+    }
+    for provider, region_map in REGION_TO_ZONE_MAP.items()
+}
+_SUPPORTED_REGIONS: dict[str, tuple[str, ...]] = {
+    provider: tuple(region_map) for provider, region_map in _ZONES.items()
+}
+_SUPPORTED_PROVIDERS: tuple[str, ...] = tuple(_ZONES)
+
+
+def _get_region_map(provider: str) -> dict[str, tuple[str, str]] | None:
+    """Get the region table for a provider, normalizing case only when needed."""
+    region_map = _ZONES.get(provider)
+    if region_map is None:
+        region_map = _ZONES.get(provider.lower())
+    return region_map
+
+
+def resolve_region(region: str, provider: str = "aws") -> tuple[str, str]:
+    """Get the canonical region code and Electricity Maps zone ID for a cloud region.
+
+    Args:
+        region: Cloud provider region code (e.g., us-west-2, eastus)
+        provider: Cloud provider name (aws, azure, gcp, digitalocean)
 
-    @staticmethod
-    def get_zone_id(region: str, provider: str = "aws") -> str:
-        """Get Electricity Maps zone ID for a cloud region.
+    Returns:
+        Tuple of the mapper's interned region code (a plain str, even when
+        region is a str subclass such as a StrEnum member) and the zone ID
 
-        Args:
-            region: Cloud provider region code (e.g., us-west-2, eastus)
-            provider: Cloud provider name (aws, azure, gcp, digitalocean)
+    Raises:
+        ValueError: If region or provider is not supported
+    """
+    region_map = _get_region_map(provider)
+    if region_map is None:
+        raise ValueError(f"Unsupported cloud provider: {provider}. Supported: {', '.join(_ZONES)}")
 
-        Returns:
-            Electricity Maps zone ID (e.g., US-CAL-CISO)
+    entry = region_map.get(region)
+    if entry is None:
+        raise ValueError(
+            f"Unsupported region '{region}' for provider '{provider}'. "
+            f"Supported regions: {', '.join(region_map)}"
+        )
 
-        Raises:
-            ValueError: If region or provider is not supported
-        """
-        provider_lower = provider.lower()
+    return entry
 
-        if provider_lower not in REGION_TO_ZONE_MAP:
-            raise ValueError(
-                f"Unsupported cloud provider: {provider}. "
-                f"Supported: {', '.join(REGION_TO_ZONE_MAP.keys())}"
-            )
 
-        region_map = REGION_TO_ZONE_MAP[provider_lower]
+def get_zone_id(region: str, provider: str = "aws") -> str:
+    """Get Electricity Maps zone ID for a cloud region.
 
-        if region not in region_map:
-            raise ValueError(
-                f"Unsupported region '{region}' for provider '{provider}'. "
-                f"Supported regions: {', '.join(region_map.keys())}"
-            )
+    Args:
+        region: Cloud provider region code (e.g., us-west-2, eastus)
+        provider: Cloud provider name (aws, azure, gcp, digitalocean)
 
-        return region_map[region]
+    Returns:
+        Electricity Maps zone ID (e.g., US-CAL-CISO)
 
-    @staticmethod
-    def get_supported_regions(provider: str = "aws") -> list[str]:
-        """Get list of supported regions for a cloud provider.
+    Raises:
+        ValueError: If region or provider is not supported
+    """
+    return resolve_region(region, provider)[1]
 
-        Args:
-            provider: Cloud provider name
 
-        Returns:
-            List of supported region codes
+def get_supported_regions(provider: str = "aws") -> tuple[str, ...]:
+    """Get supported regions for a cloud provider.
 
-        Raises:
-            ValueError: If provider is not supported
-        """
-        provider_lower = provider.lower()
+    Args:
+        provider: Cloud provider name
 
-        if provider_lower not in REGION_TO_ZONE_MAP:
-            raise ValueError(f"Unsupported cloud provider: {provider}")
+    Returns:
+        Tuple of supported region codes
 
-        return list(REGION_TO_ZONE_MAP[provider_lower].keys())
+    Raises:
+        ValueError: If provider is not supported
+    """
+    regions = _SUPPORTED_REGIONS.get(provider)
+    if regions is None:
+        regions = _SUPPORTED_REGIONS.get(provider.lower())
+    if regions is None:
+        raise ValueError(f"Unsupported cloud provider: {provider}")
+
+    return regions
+
+
+def get_supported_providers() -> tuple[str, ...]:
+    """Get all supported cloud providers.
+
+    Returns:
+        Tuple of supported provider names
+    """
+    return _SUPPORTED_PROVIDERS
+
+
+class RegionMapper:
+    """Maps cloud provider regions to Electricity Maps zone identifiers.
 
-    @staticmethod
-    def get_supported_providers() -> list[str]:
-        """Get list of all supported cloud providers.
+    Kept for backwards compatibility; the module-level functions are the
+    preferred entry points.
+    """
 
-        Returns:
-            List of supported provider names
-        """
-        return list(REGION_TO_ZONE_MAP.keys())
+    resolve_region = staticmethod(resolve_region)
+    get_zone_id = staticmethod(get_zone_id)
+    get_supported_regions = staticmethod(get_supported_regions)
+    get_supported_providers = staticmethod(get_supported_providers)
@@ -1,7 +1,8 @@
 """Contract tests for CarbonCue SDK API contracts."""
 
 import pytest
-from carboncue_sdk.models import CarbonIntensity, Region, SCIScore
+from carboncue_sdk.models import CLOUD_PROVIDERS, CarbonIntensity, Region, SCIScore
+from pydantic import ValidationError
 
 
 class TestCarbonIntensityContract:
@@ -9,12 +10,12 @@ class TestCarbonIntensityContract:
 
     def test_carbon_intensity_required_fields(self) -> None:
         """Test that required fields are enforced."""
-        with pytest.raises(Exception):  # Pydantic ValidationError
+        with pytest.raises(ValidationError):
             CarbonIntensity()  # type: ignore
 
     def test_carbon_intensity_positive_value(self) -> None:
         """Test that carbon intensity must be positive."""
-        with pytest.raises(Exception):  # Pydantic ValidationError
+        with pytest.raises(ValidationError):
             CarbonIntensity(
                 region="us-west-2",
                 carbon_intensity=-100.0,  # Invalid: must be > 0
@@ -34,7 +35,7 @@ class TestCarbonIntensityContract:
         assert intensity.renewable_percentage == 100.0
 
         # Invalid: > 100%
-        with pytest.raises(Exception):
+        with pytest.raises(ValidationError):
             CarbonIntensity(
                 region="us-west-2",
                 carbon_intensity=250.0,
@@ -42,13 +43,27 @@ class TestCarbonIntensityContract:
                 source="test",
             )
 
+        # Invalid: < 0%
+        with pytest.raises(ValidationError):
+            CarbonIntensity(
+                region="us-west-2",
+                carbon_intensity=250.0,
+                renewable_percentage=-1.0,  # Invalid: must be >= 0
+                source="test",
+            )
+
+    def test_carbon_intensity_not_revalidated(self) -> None:
+        """Test that existing instances are passed through without copying."""
+        intensity = CarbonIntensity(region="us-west-2", carbon_intensity=250.0, source="test")
+        assert CarbonIntensity.model_validate(intensity) is intensity
+
 
 class TestSCIScoreContract:
     """Contract tests for SCIScore model."""
 
     def test_sci_score_required_fields(self) -> None:
         """Test that all required fields are enforced."""
-        with pytest.raises(Exception):  # Pydantic ValidationError
+        with pytest.raises(ValidationError):
             SCIScore()  # type: ignore
 
     def test_sci_score_positive_values(self) -> None:
@@ -65,7 +80,7 @@ class TestSCIScoreContract:
         assert score.score > 0
 
         # Invalid: zero functional unit
-        with pytest.raises(Exception):
+        with pytest.raises(ValidationError):
             SCIScore(
                 score=0.15,
                 operational_emissions=100.0,
@@ -89,7 +104,7 @@ class TestSCIScoreContract:
         assert score.operational_emissions == 0.0
 
         # Invalid: negative emissions
-        with pytest.raises(Exception):
+        with pytest.raises(ValidationError):
             SCIScore(
                 score=0.15,
                 operational_emissions=-100.0,  # Invalid: must be >= 0
@@ -105,7 +120,7 @@ class TestRegionContract:
 
     def test_region_required_fields(self) -> None:
         """Test that code and provider are required."""
-        with pytest.raises(Exception):  # Pydantic ValidationError
+        with pytest.raises(ValidationError):
             Region()  # type: ignore
 
     def test_region_valid_providers(self) -> None:
@@ -114,14 +129,24 @@ class TestRegionContract:
         for provider in ["aws", "azure", "gcp", "digitalocean", "other"]:
             region = Region(code="us-west-2", provider=provider)  # type: ignore
             assert region.provider == provider
+        assert CLOUD_PROVIDERS == ("aws", "azure", "gcp", "digitalocean", "other")
 
         # Invalid provider
-        with pytest.raises(Exception):
+        with pytest.raises(ValidationError):
             Region(code="us-west-2", provider="invalid-provider")  # type: ignore
 
     def test_region_immutable(self) -> None:
         """Test that Region is immutable."""
         region = Region(code="us-west-2", provider="aws")
 
-        with pytest.raises(Exception):
+        with pytest.raises(ValidationError):
             region.code = "eu-west-1"  # type: ignore
+
+    def test_region_get_cached(self) -> None:
+        """Test that Region.get returns a shared, validated instance."""
+        region = Region.get("us-west-2", "aws")
+        assert region == Region(code="us-west-2", provider="aws")
+        assert Region.get("us-west-2", "aws") is region
+
+        with pytest.raises(ValidationError):
+            Region.get("us-west-2", "invalid-provider")  # type: ignore
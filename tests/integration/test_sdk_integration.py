@@ -62,7 +62,8 @@ async def test_multiple_regions() -> None:
     regions = ["us-west-2", "eu-west-1", "ap-southeast-1"]
 
     async with CarbonClient() as client:
-        for region in regions:
-            intensity = await client.get_current_intensity(region=region)
-            assert intensity.region == region
-            assert intensity.carbon_intensity > 0
+        intensities = await client.get_current_intensities(regions=regions)
+
+    for region, intensity in zip(regions, intensities, strict=True):
+        assert intensity.region == region
+        assert intensity.carbon_intensity > 0
@@ -0,0 +1,33 @@
+"""Unit tests for SDK configuration."""
+
+import pytest
+from carboncue_sdk import CarbonConfig
+from pydantic import ValidationError
+
+
+class TestCarbonConfig:
+    """Test suite for CarbonConfig."""
+
+    @pytest.mark.parametrize(
+        "field", ["cache_maxsize", "max_connections", "max_keepalive_connections"]
+    )
+    def test_pool_and_cache_sizes_reject_negative(self, field: str) -> None:
+        """Test that negative sizes fail when the config is loaded."""
+        with pytest.raises(ValidationError):
+            CarbonConfig(**{field: -1})
+
+    @pytest.mark.parametrize("field", ["cache_maxsize", "max_connections"])
+    def test_pool_and_cache_sizes_reject_zero(self, field: str) -> None:
+        """Test that zero cache or pool size fails when the config is loaded."""
+        with pytest.raises(ValidationError):
+            CarbonConfig(**{field: 0})
+
+    def test_keepalive_can_be_disabled(self) -> None:
+        """Test that zero keep-alive connections is allowed."""
+        assert CarbonConfig(max_keepalive_connections=0).max_keepalive_connections == 0
+
+    def test_cache_maxsize_from_environment(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that sizes loaded from the environment are validated too."""
+        monkeypatch.setenv("CARBONCUE_CACHE_MAXSIZE", "0")
+        with pytest.raises(ValidationError):
+            CarbonConfig()
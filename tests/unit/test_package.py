@@ -0,0 +1,48 @@
+"""Unit tests for the carboncue_sdk package root."""
+
+import subprocess
+import sys
+
+import carboncue_sdk
+import pytest
+from carboncue_sdk import models
+from carboncue_sdk.client import CarbonClient
+
+
+class TestLazyImports:
+    """Test suite for lazy imports from the package root."""
+
+    def test_import_does_not_load_dependencies(self) -> None:
+        """Test that a bare import leaves httpx, pydantic and msgspec unloaded."""
+        code = (
+            "import sys, carboncue_sdk\n"
+            "heavy = ('httpx', 'pydantic', 'msgspec', 'carboncue_sdk.models')\n"
+            "print(','.join(m for m in heavy if m in sys.modules))\n"
+            "print(carboncue_sdk.models.__name__)\n"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        )
+        assert result.stdout.splitlines() == ["", "carboncue_sdk.models"]
+
+    def test_public_name_resolves(self) -> None:
+        """Test that public names resolve to the defining submodule's object."""
+        assert carboncue_sdk.__getattr__("CarbonClient") is CarbonClient
+        assert carboncue_sdk.CarbonClient is CarbonClient
+
+    def test_submodule_resolves(self) -> None:
+        """Test that submodules resolve as package attributes."""
+        assert carboncue_sdk.__getattr__("models") is models
+        assert carboncue_sdk.models is models
+
+    def test_unknown_attribute_raises(self) -> None:
+        """Test that unknown names raise AttributeError."""
+        with pytest.raises(AttributeError, match="nonexistent"):
+            carboncue_sdk.nonexistent  # noqa: B018
+
+    def test_dir_lists_public_names_only(self) -> None:
+        """Test that dir() lists the public API without implementation details."""
+        names = dir(carboncue_sdk)
+        assert set(carboncue_sdk.__all__) <= set(names)
+        assert {"models", "client", "__version__"} <= set(names)
+        assert not {"Any", "TYPE_CHECKING", "import_module", "_LAZY_IMPORTS"} & set(names)
@@ -1,6 +1,9 @@
 """Unit tests for region mapper."""
 
+import sys
+
 import pytest
+from carboncue_sdk import region_mapper
 from carboncue_sdk.region_mapper import RegionMapper
 
 
@@ -43,7 +46,7 @@ class TestRegionMapper:
     def test_get_supported_regions_aws(self) -> None:
         """Test getting supported AWS regions."""
         regions = RegionMapper.get_supported_regions("aws")
-        assert isinstance(regions, list)
+        assert isinstance(regions, tuple)
         assert "us-west-2" in regions
         assert "us-east-1" in regions
         assert "eu-west-1" in regions
@@ -51,7 +54,7 @@ class TestRegionMapper:
     def test_get_supported_regions_azure(self) -> None:
         """Test getting supported Azure regions."""
         regions = RegionMapper.get_supported_regions("azure")
-        assert isinstance(regions, list)
+        assert isinstance(regions, tuple)
         assert "eastus" in regions
         assert "westeurope" in regions
 
@@ -63,8 +66,21 @@ class TestRegionMapper:
     def test_get_supported_providers(self) -> None:
         """Test getting all supported providers."""
         providers = RegionMapper.get_supported_providers()
-        assert isinstance(providers, list)
+        assert isinstance(providers, tuple)
         assert "aws" in providers
         assert "azure" in providers
         assert "gcp" in providers
         assert "digitalocean" in providers
+
+    def test_module_functions_match_class(self) -> None:
+        """Test that module-level functions back the RegionMapper API."""
+        assert region_mapper.get_zone_id("us-west-2", "aws") == "US-NW-PACW"
+        assert region_mapper.get_zone_id("eastus", "AZURE") == "US-VA"
+        assert RegionMapper.get_zone_id is region_mapper.get_zone_id
+        assert RegionMapper.resolve_region is region_mapper.resolve_region
+
+    def test_resolve_region_returns_canonical_key(self) -> None:
+        """Test that resolve_region returns the mapper's own region string."""
+        region, zone_id = region_mapper.resolve_region("".join(["us-", "west-2"]), "aws")
+        assert zone_id == "US-NW-PACW"
+        assert region is sys.intern("us-west-2")
@@ -1,6 +1,10 @@
 """Unit tests for CarbonCue SDK client."""
 
+import asyncio
+import json
+import sys
 from datetime import datetime
+from enum import StrEnum
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import httpx
@@ -15,11 +19,17 @@ from carboncue_sdk.exceptions import (
     RateLimitError,
 )
 from carboncue_sdk.models import CarbonIntensity, SCIScore
+from pydantic import BaseModel, Field, ValidationError, computed_field
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def client() -> CarbonClient:
-    """Create a test client with mock configuration."""
+    """Create a test client with mock configuration, shared across this module.
+
+    Caching is disabled and each test opens and closes the pool with
+    ``async with client``, so the client holds no state between tests (each
+    runs on its own event loop); tests that need caching build their own client.
+    """
     config = CarbonConfig(
         electricity_maps_api_key="test-key",
         enable_caching=False,  # Disable caching for tests
@@ -68,6 +78,16 @@ class TestCarbonClient:
                 functional_unit_type="requests",
             )
 
+    def test_calculate_sci_negative_emissions(self, client: CarbonClient) -> None:
+        """Test SCI calculation with negative emissions raises error."""
+        with pytest.raises(ValueError, match="Emissions must be greater than or equal to 0"):
+            client.calculate_sci(
+                operational_emissions=-100.0,
+                embodied_emissions=50.0,
+                functional_unit=1000,
+                functional_unit_type="requests",
+            )
+
     def test_calculate_sci_zero_emissions(self, client: CarbonClient) -> None:
         """Test SCI calculation with zero emissions."""
         score = client.calculate_sci(
@@ -81,16 +101,38 @@ class TestCarbonClient:
         assert score.operational_emissions == 0.0
         assert score.embodied_emissions == 0.0
 
-    @pytest.mark.asyncio
+    def test_calculate_sci_batch(self, client: CarbonClient) -> None:
+        """Test batch SCI calculation matches single calculations."""
+        scores = client.calculate_sci_batch(
+            operational_emissions=[100.0, 0.0, 30.0],
+            embodied_emissions=[50.0, 0.0, 10.0],
+            functional_units=[1000, 10, 4],
+            functional_unit_type="requests",
+            region="us-west-2",
+        )
+
+        assert [s.score for s in scores] == [0.15, 0.0, 10.0]
+        assert all(isinstance(s, SCIScore) for s in scores)
+        assert all(s.region == "us-west-2" for s in scores)
+
+    def test_calculate_sci_batch_invalid(self, client: CarbonClient) -> None:
+        """Test batch SCI calculation rejects invalid inputs up front."""
+        assert client.calculate_sci_batch([], [], []) == []
+
+        with pytest.raises(ValueError, match="same length"):
+            client.calculate_sci_batch([100.0], [50.0, 10.0], [1000])
+        with pytest.raises(ValueError, match="Functional unit must be greater than 0"):
+            client.calculate_sci_batch([100.0, 100.0], [50.0, 50.0], [1000, 0])
+        with pytest.raises(ValueError, match="Emissions must be greater than or equal to 0"):
+            client.calculate_sci_batch([100.0, -1.0], [50.0, 50.0], [1000, 1000])
+
     async def test_get_current_intensity(self, client: CarbonClient) -> None:
         """Test getting current carbon intensity with mocked API."""
         mock_response = MagicMock()
         mock_response.status_code = 200
-        mock_response.json.return_value = {
-            "carbonIntensity": 250.5,
-            "fossilFuelPercentage": 60.0,
-            "renewablePercentage": 40.0,
-        }
+        mock_response.content = (
+            b'{"carbonIntensity": 250.5, "fossilFuelPercentage": 60.0, "renewablePercentage": 40.0}'
+        )
 
         async with client:
             with patch.object(client._http_client, "get", return_value=mock_response):
@@ -102,22 +144,41 @@ class TestCarbonClient:
         assert intensity.fossil_fuel_percentage == 60.0
         assert intensity.renewable_percentage == 40.0
         assert intensity.source == "ElectricityMaps"
+        mock_response.json.assert_not_called()  # Raw bytes are decoded directly
+        assert intensity.region is sys.intern("us-west-2")
+
+    async def test_get_current_intensity_str_enum_region(self, client: CarbonClient) -> None:
+        """Test that str subclasses such as StrEnum members are accepted as regions."""
+
+        class AwsRegion(StrEnum):
+            US_WEST_2 = "us-west-2"
+            EU_WEST_1 = "eu-west-1"
+
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.content = b'{"carbonIntensity": 250.5}'
+
+        async with client:
+            with patch.object(client._http_client, "get", return_value=mock_response):
+                intensity = await client.get_current_intensity(AwsRegion.US_WEST_2, "aws")
+                intensities = await client.get_current_intensities(list(AwsRegion), "aws")
+
+        assert intensity.region == "us-west-2"
+        assert type(intensity.region) is str
+        assert [i.region for i in intensities] == ["us-west-2", "eu-west-1"]
 
-    @pytest.mark.asyncio
     async def test_get_current_intensity_invalid_region(self, client: CarbonClient) -> None:
         """Test that invalid region raises InvalidRegionError."""
         async with client:
             with pytest.raises(InvalidRegionError, match="Unsupported region"):
                 await client.get_current_intensity(region="invalid-region", provider="aws")
 
-    @pytest.mark.asyncio
     async def test_get_current_intensity_invalid_provider(self, client: CarbonClient) -> None:
         """Test that invalid provider raises InvalidProviderError."""
         async with client:
             with pytest.raises(InvalidProviderError, match="Unsupported cloud provider"):
                 await client.get_current_intensity(region="us-west-2", provider="invalid")
 
-    @pytest.mark.asyncio
     async def test_get_current_intensity_no_api_key(self) -> None:
         """Test that missing API key raises AuthenticationError."""
         config = CarbonConfig(electricity_maps_api_key=None)
@@ -127,7 +188,6 @@ class TestCarbonClient:
             with pytest.raises(AuthenticationError, match="API key not configured"):
                 await client.get_current_intensity(region="us-west-2")
 
-    @pytest.mark.asyncio
     async def test_get_current_intensity_rate_limit(self, client: CarbonClient) -> None:
         """Test that rate limit response raises RateLimitError."""
         mock_response = MagicMock()
@@ -138,7 +198,6 @@ class TestCarbonClient:
                 with pytest.raises(RateLimitError, match="rate limit exceeded"):
                     await client.get_current_intensity(region="us-west-2")
 
-    @pytest.mark.asyncio
     async def test_get_current_intensity_auth_error(self, client: CarbonClient) -> None:
         """Test that 401 response raises AuthenticationError."""
         mock_response = MagicMock()
@@ -149,7 +208,6 @@ class TestCarbonClient:
                 with pytest.raises(AuthenticationError, match="Invalid"):
                     await client.get_current_intensity(region="us-west-2")
 
-    @pytest.mark.asyncio
     async def test_get_current_intensity_data_not_available(self, client: CarbonClient) -> None:
         """Test that 404 response raises DataNotAvailableError."""
         mock_response = MagicMock()
@@ -160,7 +218,32 @@ class TestCarbonClient:
                 with pytest.raises(DataNotAvailableError, match="not available"):
                     await client.get_current_intensity(region="us-west-2")
 
-    @pytest.mark.asyncio
+    async def test_get_current_intensity_missing_value(self, client: CarbonClient) -> None:
+        """Test that a response without an intensity raises DataNotAvailableError."""
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.content = b'{"carbonIntensity": null}'
+
+        async with client:
+            with (
+                patch.object(client._http_client, "get", return_value=mock_response),
+                pytest.raises(DataNotAvailableError, match="value missing"),
+            ):
+                await client.get_current_intensity(region="us-west-2")
+
+    async def test_get_current_intensity_invalid_payload(self, client: CarbonClient) -> None:
+        """Test that an out-of-range response raises APIError."""
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.content = b'{"carbonIntensity": -5.0}'
+
+        async with client:
+            with (
+                patch.object(client._http_client, "get", return_value=mock_response),
+                pytest.raises(APIError, match="Invalid carbon intensity data"),
+            ):
+                await client.get_current_intensity(region="us-west-2")
+
     async def test_get_current_intensity_caching(self) -> None:
         """Test that caching works correctly."""
         config = CarbonConfig(electricity_maps_api_key="test-key", enable_caching=True)
@@ -168,11 +251,9 @@ class TestCarbonClient:
 
         mock_response = MagicMock()
         mock_response.status_code = 200
-        mock_response.json.return_value = {
-            "carbonIntensity": 250.5,
-            "fossilFuelPercentage": 60.0,
-            "renewablePercentage": 40.0,
-        }
+        mock_response.content = (
+            b'{"carbonIntensity": 250.5, "fossilFuelPercentage": 60.0, "renewablePercentage": 40.0}'
+        )
 
         async with client:
             with patch.object(client._http_client, "get", return_value=mock_response) as mock_get:
@@ -187,7 +268,74 @@ class TestCarbonClient:
                 # Both should have same values
                 assert intensity1.carbon_intensity == intensity2.carbon_intensity
 
-    @pytest.mark.asyncio
+    async def test_get_current_intensities(self, client: CarbonClient) -> None:
+        """Test that regions sharing a zone are fetched with one request."""
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.content = b'{"carbonIntensity": 250.5}'
+
+        async with client:
+            with patch.object(client._http_client, "get", return_value=mock_response) as mock_get:
+                intensities = await client.get_current_intensities(
+                    regions=["eastus", "westeurope", "eastus2"], provider="azure"
+                )
+
+        assert mock_get.call_count == 2  # eastus and eastus2 both map to US-VA
+        assert [i.region for i in intensities] == ["eastus", "westeurope", "eastus2"]
+        assert all(i.carbon_intensity == 250.5 for i in intensities)
+
+    async def test_get_current_intensities_invalid_region(self, client: CarbonClient) -> None:
+        """Test that an invalid region fails before any request is sent."""
+        async with client:
+            with (
+                patch.object(client._http_client, "get") as mock_get,
+                pytest.raises(InvalidRegionError, match="Unsupported region"),
+            ):
+                await client.get_current_intensities(regions=["us-west-2", "invalid-region"])
+
+        mock_get.assert_not_called()
+
+    async def test_get_current_intensity_caching_shared_zone(self) -> None:
+        """Test that regions mapping to the same zone share a cache entry."""
+        config = CarbonConfig(electricity_maps_api_key="test-key", enable_caching=True)
+        client = CarbonClient(config=config)
+
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.content = b'{"carbonIntensity": 250.5}'
+
+        async with client:
+            with patch.object(client._http_client, "get", return_value=mock_response) as mock_get:
+                intensity1 = await client.get_current_intensity(region="eastus", provider="azure")
+                intensity2 = await client.get_current_intensity(region="eastus2", provider="azure")
+
+        assert mock_get.call_count == 1  # Both regions map to US-VA
+        assert intensity1.region == "eastus"
+        assert intensity2.region == "eastus2"
+        assert intensity1.timestamp == intensity2.timestamp
+
+    async def test_get_current_intensity_caching_concurrent(self) -> None:
+        """Test that concurrent cache misses for a zone trigger a single request."""
+        config = CarbonConfig(electricity_maps_api_key="test-key", enable_caching=True)
+        client = CarbonClient(config=config)
+
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.content = b'{"carbonIntensity": 250.5}'
+
+        async def slow_get(*args: object, **kwargs: object) -> MagicMock:
+            await asyncio.sleep(0.01)
+            return mock_response
+
+        async with client:
+            with patch.object(client._http_client, "get", side_effect=slow_get) as mock_get:
+                await asyncio.gather(
+                    client.get_current_intensity(region="us-west-2"),
+                    client.get_current_intensity(region="us-west-2"),
+                )
+
+        assert mock_get.call_count == 1
+
     async def test_context_manager(self) -> None:
         """Test async context manager."""
         config = CarbonConfig(electricity_maps_api_key="test")
@@ -197,6 +345,74 @@ class TestCarbonClient:
         # Client should be closed after context
         assert client._http_client is None
 
+    async def test_http_client_created_lazily(self, client: CarbonClient) -> None:
+        """Test that calls outside a context manager create and reuse one pool."""
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.content = b'{"carbonIntensity": 250.5}'
+
+        try:
+            with patch.object(httpx.AsyncClient, "get", return_value=mock_response):
+                await client.get_current_intensity(region="us-west-2")
+                http_client = client._http_client
+                await client.get_current_intensity(region="eu-west-1")
+
+            assert http_client is not None
+            assert client._http_client is http_client
+        finally:
+            await client.close()
+
+    async def test_use_session(self) -> None:
+        """Test that a bound session is used in the current and child tasks."""
+        client = CarbonClient(
+            CarbonConfig(electricity_maps_api_key="test-key", enable_caching=False)
+        )
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.content = b'{"carbonIntensity": 250.5}'
+        session = MagicMock(spec=httpx.AsyncClient)
+        session.get = AsyncMock(return_value=mock_response)
+
+        with CarbonClient.use_session(session):
+            await asyncio.gather(
+                client.get_current_intensity(region="us-west-2"),
+                client.get_current_intensity(region="eu-west-1"),
+            )
+
+        assert session.get.call_count == 2
+        assert session.get.call_args.kwargs["headers"] == {"auth-token": "test-key"}
+        assert client._http_client is None  # Own pool was never created
+
+    def test_shared_client(self) -> None:
+        """Test that shared() returns a single process-wide client."""
+        assert CarbonClient.shared() is CarbonClient.shared()
+
+    def test_client_reused_across_event_loops(self) -> None:
+        """Test that a client survives one asyncio.run per call (e.g. warm Lambdas)."""
+        client = CarbonClient(CarbonConfig(electricity_maps_api_key="test-key"))
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.content = b'{"carbonIntensity": 250.5}'
+
+        async def get(*args: object, **kwargs: object) -> MagicMock:
+            await asyncio.sleep(0)  # Let the second lookup wait on the zone lock
+            return mock_response
+
+        async def lookup() -> list[CarbonIntensity]:
+            client._cache.clear()  # type: ignore[union-attr]
+            return await asyncio.gather(
+                client.get_current_intensity("us-west-2"),
+                client.get_current_intensity("us-west-2"),
+            )
+
+        with patch.object(httpx.AsyncClient, "get", side_effect=get):
+            first = asyncio.run(lookup())
+            first_pool = client._http_client
+            second = asyncio.run(lookup())
+
+        assert [i.carbon_intensity for i in first + second] == [250.5] * 4
+        assert client._http_client is not first_pool  # Rebuilt for the new loop
+
 
 class TestCarbonIntensity:
     """Test suite for CarbonIntensity model."""
@@ -225,9 +441,47 @@ class TestCarbonIntensity:
             source="test",
         )
 
-        with pytest.raises(Exception):  # Pydantic ValidationError
+        with pytest.raises(ValidationError):
             intensity.carbon_intensity = 300.0  # type: ignore
 
+    def test_carbon_intensity_json(self) -> None:
+        """Test that the fast JSON path matches Pydantic's serializer."""
+        intensity = CarbonIntensity(
+            region="us-west-2",
+            carbon_intensity=250.5,
+            fossil_fuel_percentage=60.0,
+            source="ElectricityMaps",
+        )
+
+        assert intensity.model_dump_json() == BaseModel.model_dump_json(intensity)
+        assert intensity.model_dump_json(indent=2) == BaseModel.model_dump_json(intensity, indent=2)
+
+    def test_carbon_intensity_json_large_float(self) -> None:
+        """Test that large floats encode to the same value as Pydantic's serializer."""
+        intensity = CarbonIntensity(region="us-west-2", carbon_intensity=1e16, source="test")
+
+        assert json.loads(intensity.model_dump_json()) == json.loads(
+            BaseModel.model_dump_json(intensity)
+        )
+
+    def test_carbon_intensity_json_subclass(self) -> None:
+        """Test that subclasses keep Pydantic's exclude and computed field rules."""
+
+        class TaggedIntensity(CarbonIntensity):
+            secret: str = Field("x", exclude=True)
+
+            @computed_field  # type: ignore[prop-decorator]
+            @property
+            def kg(self) -> float:
+                return self.carbon_intensity / 1000
+
+        intensity = TaggedIntensity(region="us-west-2", carbon_intensity=250.0, source="test")
+        data = json.loads(intensity.model_dump_json())
+
+        assert "secret" not in data
+        assert data["kg"] == 0.25
+        assert intensity.model_dump_json() == BaseModel.model_dump_json(intensity)
+
 
 class TestSCIScore:
     """Test suite for SCIScore model."""
@@ -261,5 +515,18 @@ class TestSCIScore:
             region="us-west-2",
         )
 
-        with pytest.raises(Exception):  # Pydantic ValidationError
+        with pytest.raises(ValidationError):
             score.score = 0.20  # type: ignore
+
+    def test_sci_score_json(self) -> None:
+        """Test that the fast JSON path matches Pydantic's serializer."""
+        score = SCIScore(
+            score=0.15,
+            operational_emissions=100.0,
+            embodied_emissions=50.0,
+            functional_unit=1000,
+            functional_unit_type="requests",
+            region="us-west-2",
+        )
+
+        assert score.model_dump_json() == BaseModel.model_dump_json(score)